@@ -1,25 +1,24 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
-from sqlmodel import select
+import asyncio
+import logging
 import time
 
 # Internal imports
-from app.models.fertilizer import Fertilizer
-from app.services import rag_service, rerank_service # <--- IMPORT NEW SERVICE
+from app.services import crop_matcher, db_service, rag_service, rerank_service
 from app.core.config import settings
+from app.utils.text import normalize_text
 
-# --- Database Setup ---
-engine = create_async_engine(settings.DATABASE_URL, echo=False)
-async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-
-async def get_db():
-    async with async_session() as session:
-        yield session
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+COLLECTION_NAME = "docs_kisangpt_advanced"
+
+# Process-wide cap on concurrent Gemini calls made by /ask/batch, shared by all batch requests
+batch_llm_semaphore = asyncio.Semaphore(settings.BATCH_LLM_CONCURRENCY)
+
 # --- Schemas ---
 class ChatRequest(BaseModel):
     query: str
@@ -30,27 +29,40 @@ class ChatResponse(BaseModel):
     sources: list[dict] # Changed to list[dict] to show scores
     processing_time: float
 
+class BatchChatRequest(BaseModel):
+    questions: list[ChatRequest]
+
+class BatchChatResponseItem(ChatResponse):
+    index: int # Position of the question in the submitted batch
+
+class BatchChatErrorItem(BaseModel):
+    index: int
+    error: str
+
+# --- Helpers ---
+def build_sources(reranked_results: list) -> list[dict]:
+    """
+    Turns the reranked Qdrant points into the 'sources' list of the response.
+    """
+    source_list = []
+    for hit in reranked_results:
+        if hit.payload:
+            source_list.append({
+                "source": hit.payload.get("source", "PDF"),
+                "score": hit.payload.get("rerank_score", 0.0),
+                "text_preview": hit.payload.get("text", "")[:50] + "..."
+            })
+    return source_list
+
 # --- Endpoint ---
 @router.post("/ask", response_model=ChatResponse)
-async def ask_question(request: ChatRequest, db: AsyncSession = Depends(get_db)):
+async def ask_question(request: ChatRequest):
     start_time = time.time()
     user_query = request.query
     
-    # 1. SQL Search (Structured)
-    stmt = select(Fertilizer)
-    result = await db.execute(stmt)
-    all_fertilizers = result.scalars().all()
-    
-    found_fertilizer = None
-    for fert in all_fertilizers:
-        if fert.crop_name.lower() in user_query.lower():
-            found_fertilizer = {
-                "crop_name": fert.crop_name,
-                "n_value": fert.n_value,
-                "p_value": fert.p_value,
-                "k_value": fert.k_value
-            }
-            break
+    # 1. SQL Search (Structured) - crop names in any supported language
+    await db_service.refresh_if_stale() # Recompiles the crop matcher if the table changed
+    found_fertilizer = crop_matcher.find_fertilizer(normalize_text(user_query))
             
     # 2. Vector Search (Broad Retrieval)
     # We fetch 15 docs (Wide Net) instead of 4
@@ -58,7 +70,7 @@ async def ask_question(request: ChatRequest, db: AsyncSession = Depends(get_db))
     
     initial_results = await rag_service.search_vector_db(
         query_vector, 
-        collection_name="docs_kisangpt_advanced", # Use your new collection name
+        collection_name=COLLECTION_NAME,
         top_k=15 
     )
     
@@ -81,17 +93,87 @@ async def ask_question(request: ChatRequest, db: AsyncSession = Depends(get_db))
     bot_answer = await rag_service.generate_answer(prompt)
     
     # 5. Prepare Sources (Now with Scores!)
-    source_list = []
-    for hit in reranked_results:
-        if hit.payload:
-            source_list.append({
-                "source": hit.payload.get("source", "PDF"),
-                "score": hit.payload.get("rerank_score", 0.0),
-                "text_preview": hit.payload.get("text", "")[:50] + "..."
-            })
+    source_list = build_sources(reranked_results)
     
     return ChatResponse(
         answer=bot_answer,
         sources=source_list,
         processing_time=time.time() - start_time
-    )
\ No newline at end of file
+    )
+
+@router.post("/ask/batch")
+async def ask_questions_batch(request: BatchChatRequest):
+    """
+    Answers many questions at once (call-centre / FPO integrations).
+    Retrieval is batched end-to-end; answers are streamed back as NDJSON,
+    one BatchChatResponseItem per line, in completion order. A question that
+    fails produces a BatchChatErrorItem line instead; the others still arrive.
+    """
+    start_time = time.time()
+    questions = request.questions
+
+    if not questions:
+        raise HTTPException(status_code=422, detail="'questions' must not be empty")
+    if len(questions) > settings.BATCH_MAX_QUESTIONS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"A batch may contain at most {settings.BATCH_MAX_QUESTIONS} questions"
+        )
+
+    user_queries = [q.query for q in questions]
+
+    # 1. SQL Search (Structured) - crop names in any supported language
+    await db_service.refresh_if_stale() # Recompiles the crop matcher if the table changed
+    found_fertilizers = [crop_matcher.find_fertilizer(normalize_text(q)) for q in user_queries]
+
+    # 2. Vector Search - one encode call, one Qdrant batch request
+    query_vectors = await rag_service.get_embeddings(user_queries)
+    initial_results = await rag_service.search_vector_db_batch(
+        query_vectors,
+        collection_name=COLLECTION_NAME,
+        top_k=15
+    )
+
+    # 3. Re-ranking - all (query, doc) pairs in one Cross-Encoder pass
+    reranked_results = await rerank_service.rerank_documents_batch(
+        queries=user_queries,
+        docs_per_query=initial_results,
+        top_k=5
+    )
+
+    # 4. Generate Answers concurrently, capped by the process-wide semaphore
+    async def answer_one(index: int) -> BatchChatResponseItem | BatchChatErrorItem:
+        try:
+            prompt = rag_service.format_rag_prompt(
+                query=user_queries[index],
+                retrieved_docs=reranked_results[index],
+                fertilizer_info=found_fertilizers[index],
+                language=questions[index].language
+            )
+            async with batch_llm_semaphore:
+                bot_answer = await rag_service.generate_answer(prompt)
+
+            return BatchChatResponseItem(
+                index=index,
+                answer=bot_answer,
+                sources=build_sources(reranked_results[index]),
+                processing_time=time.time() - start_time
+            )
+        except Exception as e:
+            # e.g. a blocked Gemini response (text=None) failing validation
+            logger.exception("Batch question %d failed", index)
+            return BatchChatErrorItem(index=index, error=str(e) or type(e).__name__)
+
+    # 5. Stream each answer as soon as it is ready
+    async def stream_answers():
+        tasks = [asyncio.create_task(answer_one(i)) for i in range(len(questions))]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                item = await next_done
+                yield item.model_dump_json() + "\n"
+        finally:
+            # Client went away: don't keep calling Gemini
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(stream_answers(), media_type="application/x-ndjson")
\ No newline at end of file
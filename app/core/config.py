@@ -1,3 +1,5 @@
+from typing import Literal
+from pydantic import model_validator
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
@@ -7,11 +9,32 @@ class Settings(BaseSettings):
     
     
     GEMINI_API_KEY: str
-    QDRANT_URL: str
-    QDRANT_API_KEY: str
+    QDRANT_URL: str = ""
+    QDRANT_API_KEY: str = ""
+
+    # Vector search backend: "qdrant" (remote) or "local" (memory-mapped index on disk)
+    VECTOR_BACKEND: Literal["qdrant", "local"] = "qdrant"
+    LOCAL_INDEX_DIR: str = "./vector_index"
+    LOCAL_INDEX_DTYPE: Literal["float32", "float16"] = "float32" # float16 halves the index size
     
     # Database
     DATABASE_URL: str = "sqlite+aiosqlite:///./kisan_database.db"
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800 # seconds
+    DB_BUSY_TIMEOUT: float = 30.0 # seconds a SQLite connection waits for a lock
+    FERTILIZER_CACHE_TTL: float = 300.0 # seconds
+
+    # Batch endpoint (/ask/batch)
+    BATCH_MAX_QUESTIONS: int = 100
+    BATCH_LLM_CONCURRENCY: int = 4 # per process, shared by all batch requests
+
+    @model_validator(mode="after")
+    def check_vector_backend(self):
+        # Qdrant credentials are only optional when the local index is used
+        if self.VECTOR_BACKEND == "qdrant" and not (self.QDRANT_URL and self.QDRANT_API_KEY):
+            raise ValueError("QDRANT_URL and QDRANT_API_KEY are required when VECTOR_BACKEND='qdrant'")
+        return self
 
     class Config:
         env_file = ".env"
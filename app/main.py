@@ -1,8 +1,20 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from app.api.v1 import chat
 from app.core.config import settings
+from app.services import db_service, rag_service
 
-app = FastAPI(title=settings.PROJECT_NAME)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Make sure tables exist and warm the fertilizer cache before the first request
+    await db_service.init_db()
+    await db_service.get_all_fertilizers()
+    if settings.VECTOR_BACKEND == "local":
+        rag_service.load_local_index(chat.COLLECTION_NAME)
+    yield
+    await db_service.engine.dispose()
+
+app = FastAPI(title=settings.PROJECT_NAME, lifespan=lifespan)
 
 # Register the Chat Router
 app.include_router(chat.router, prefix="/api/v1/chat", tags=["chat"])
@@ -0,0 +1,38 @@
+from app.models.fertilizer import Fertilizer
+from app.services import db_service
+from app.utils.crop_aliases import crop_phrases
+from app.utils.text import PhraseMatcher
+
+# Finds which fertilizer row a query talks about, in any supported language.
+# The matcher is compiled from the fertilizer table + CROP_ALIASES/MARATHI_STEMS and rebuilt
+# whenever db_service reports that the table changed (first load = app startup).
+
+_matcher = PhraseMatcher({})
+
+def build_matcher(fertilizers: list[Fertilizer]) -> PhraseMatcher:
+    phrases, stems = {}, {}
+    for fert in fertilizers:
+        info = {
+            "crop_name": fert.crop_name,
+            "n_value": fert.n_value,
+            "p_value": fert.p_value,
+            "k_value": fert.k_value
+        }
+        names, crop_stems = crop_phrases(fert.crop_name)
+        phrases.update(dict.fromkeys(names, info))
+        stems.update(dict.fromkeys(crop_stems, info))
+    return PhraseMatcher(phrases, stems)
+
+def _rebuild(fertilizers: list[Fertilizer]):
+    global _matcher
+    _matcher = build_matcher(fertilizers)
+    print(f"Crop matcher compiled: {len(fertilizers)} crops, {len(_matcher)} states")
+
+db_service.subscribe_fertilizer_changes(_rebuild)
+
+def find_fertilizer(normalized_query: str) -> dict | None:
+    """
+    Returns the fertilizer info of the crop mentioned in the query (longest name wins).
+    Expects a query already passed through normalize_text().
+    """
+    return _matcher.find_longest(normalized_query)
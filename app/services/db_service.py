@@ -0,0 +1,157 @@
+import asyncio
+import logging
+import time
+from typing import Callable
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import SQLModel, select
+
+from app.models.fertilizer import Fertilizer, FertilizerCreate
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# --- Engine (one per process, shared by the API and the scripts) ---
+
+def _engine_kwargs(url: str) -> dict:
+    kwargs = {"echo": False, "pool_pre_ping": True}
+    if ":memory:" not in url:
+        # In-memory SQLite needs a single static connection, everything else gets a real pool
+        kwargs.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+        )
+    if url.startswith("sqlite"):
+        # Wait for a concurrent writer instead of failing with "database is locked"
+        kwargs["connect_args"] = {"timeout": settings.DB_BUSY_TIMEOUT}
+    return kwargs
+
+engine = create_async_engine(settings.DATABASE_URL, **_engine_kwargs(settings.DATABASE_URL))
+async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        # WAL lets API readers keep going while a script writes
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+async def init_db():
+    """
+    Creates missing tables.
+    """
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+# --- Fertilizer reads (cached) ---
+
+_fertilizer_cache: list[Fertilizer] | None = None
+_fertilizer_cache_loaded_at = 0.0
+_fertilizer_cache_lock = asyncio.Lock()
+_fertilizer_listeners: list[Callable[[list[Fertilizer]], None]] = []
+
+def subscribe_fertilizer_changes(callback: Callable[[list[Fertilizer]], None]):
+    """
+    Registers a callback that receives the fresh fertilizer list whenever
+    the cache is reloaded after a change.
+    """
+    _fertilizer_listeners.append(callback)
+
+def invalidate_fertilizer_cache():
+    # Keep the old rows around so the next reload can tell whether anything changed
+    global _fertilizer_cache_loaded_at
+    _fertilizer_cache_loaded_at = float("-inf")
+
+async def get_all_fertilizers() -> list[Fertilizer]:
+    """
+    Returns every fertilizer row, served from memory.
+    The cache is dropped on writes made through this module, and expires after
+    FERTILIZER_CACHE_TTL seconds to pick up writes from other processes.
+    """
+    global _fertilizer_cache, _fertilizer_cache_loaded_at
+
+    if _fertilizer_cache is not None and time.monotonic() - _fertilizer_cache_loaded_at < settings.FERTILIZER_CACHE_TTL:
+        return _fertilizer_cache
+
+    async with _fertilizer_cache_lock:
+        # Another request may have reloaded it while we waited
+        if _fertilizer_cache is not None and time.monotonic() - _fertilizer_cache_loaded_at < settings.FERTILIZER_CACHE_TTL:
+            return _fertilizer_cache
+
+        previous = _fertilizer_cache
+        async with async_session() as session:
+            result = await session.execute(select(Fertilizer).order_by(Fertilizer.id))
+            fresh = list(result.scalars().all())
+
+        _fertilizer_cache = fresh
+        _fertilizer_cache_loaded_at = time.monotonic()
+
+    if previous is None or _snapshot(previous) != _snapshot(fresh):
+        for callback in _fertilizer_listeners:
+            # A broken subscriber must not fail the request that triggered the reload
+            try:
+                callback(fresh)
+            except Exception:
+                logger.exception("Fertilizer change subscriber %r failed", callback)
+
+    return fresh
+
+async def refresh_if_stale():
+    """
+    Reloads the fertilizer cache (and notifies subscribers of changes)
+    if it has expired; otherwise does nothing.
+    """
+    await get_all_fertilizers()
+
+def _snapshot(rows: list[Fertilizer]) -> list[tuple]:
+    return [(f.id, f.crop_name, f.n_value, f.p_value, f.k_value) for f in rows]
+
+# --- Fertilizer writes (bulk) ---
+
+UPSERT_CHUNK_SIZE = 500
+
+def _insert_for_dialect():
+    if engine.dialect.name == "sqlite":
+        return sqlite.insert
+    if engine.dialect.name == "postgresql":
+        return postgresql.insert
+    raise NotImplementedError(f"Bulk upsert is not supported for '{engine.dialect.name}'")
+
+async def upsert_fertilizers(rows: list[FertilizerCreate], overwrite: bool = True) -> int:
+    """
+    Inserts many fertilizer rows with INSERT ... ON CONFLICT (crop_name).
+    overwrite=True updates the NPK values of existing crops,
+    overwrite=False leaves existing crops untouched.
+    Returns the number of rows sent.
+    """
+    if not rows:
+        return 0
+
+    insert = _insert_for_dialect()
+    values = [row.model_dump() for row in rows]
+
+    async with engine.begin() as conn:
+        for start in range(0, len(values), UPSERT_CHUNK_SIZE):
+            stmt = insert(Fertilizer).values(values[start:start + UPSERT_CHUNK_SIZE])
+            if overwrite:
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["crop_name"],
+                    set_={
+                        "n_value": stmt.excluded.n_value,
+                        "p_value": stmt.excluded.p_value,
+                        "k_value": stmt.excluded.k_value,
+                    }
+                )
+            else:
+                stmt = stmt.on_conflict_do_nothing(index_elements=["crop_name"])
+            await conn.execute(stmt)
+
+    # Reload right away so subscribers hear about the change
+    invalidate_fertilizer_cache()
+    await get_all_fertilizers()
+    return len(values)
@@ -0,0 +1,235 @@
+import json
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+
+import numpy as np
+
+# Local, embedded alternative to Qdrant (VECTOR_BACKEND="local").
+# Each collection is a directory of immutable versions plus a CURRENT pointer:
+#   <collection>/CURRENT                  : name of the live version
+#   <collection>/<version>/vectors.npy     : L2-normalised (N, dim) float32/float16 matrix, memory-mapped on load
+#   <collection>/<version>/payloads.sqlite : one JSON payload per row id
+# A rebuild writes a new version and then swaps CURRENT with one os.replace, so a
+# reader always sees vectors and payloads from the same build.
+# Because the rows are normalised, cosine similarity is a plain dot product,
+# so search is an exact matmul over the mapped matrix (no copy into RAM).
+
+VECTORS_FILE = "vectors.npy"
+PAYLOADS_FILE = "payloads.sqlite"
+CURRENT_FILE = "CURRENT"
+
+# Storage types that keep normalised vectors usable (integer types would truncate them)
+DTYPES = ("float32", "float16")
+
+# Seconds between checks of CURRENT for a newly published version
+VERSION_CHECK_INTERVAL = 5.0
+
+# Versions kept on disk: the live one and the previous one (still mapped by running workers)
+KEEP_VERSIONS = 2
+
+# Rows scored per matmul; only a (queries x block) score matrix is ever held in memory
+SEARCH_BLOCK_ROWS = 65536
+
+@dataclass
+class LocalPoint:
+    """
+    Mirrors the fields of a Qdrant ScoredPoint that the rest of the app uses.
+    """
+    id: int
+    score: float
+    payload: dict = field(default_factory=dict)
+
+def write_index(collection_dir: str, embeddings, payloads: list[dict], dtype: str = "float32") -> str:
+    """
+    Builds a new version of a collection from embeddings and their payloads,
+    then makes it the live one. Row i of 'embeddings' gets id i and payload payloads[i].
+    Returns the directory of the new version.
+    """
+    if dtype not in DTYPES:
+        raise ValueError(f"dtype must be one of {DTYPES}, got '{dtype}'")
+
+    vectors = np.asarray(embeddings, dtype=np.float32)
+    if vectors.ndim != 2 or len(vectors) != len(payloads):
+        raise ValueError("embeddings must be a 2D array with one row per payload")
+
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    vectors = vectors / np.maximum(norms, 1e-12)
+
+    # 1. Write the whole build into its own fresh directory
+    version = f"v{time.time_ns()}"
+    version_dir = os.path.join(collection_dir, version)
+    os.makedirs(version_dir)
+
+    with open(os.path.join(version_dir, VECTORS_FILE), "wb") as f:
+        np.save(f, vectors.astype(dtype))
+
+    conn = sqlite3.connect(os.path.join(version_dir, PAYLOADS_FILE))
+    try:
+        conn.execute("CREATE TABLE points (id INTEGER PRIMARY KEY, payload TEXT NOT NULL)")
+        conn.executemany(
+            "INSERT INTO points (id, payload) VALUES (?, ?)",
+            ((i, json.dumps(p, ensure_ascii=False)) for i, p in enumerate(payloads))
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+    # 2. Swap the pointer in one atomic step
+    tmp_current = os.path.join(collection_dir, CURRENT_FILE + ".tmp")
+    with open(tmp_current, "w") as f:
+        f.write(version)
+    os.replace(tmp_current, os.path.join(collection_dir, CURRENT_FILE))
+
+    _prune_versions(collection_dir)
+    return version_dir
+
+def _prune_versions(collection_dir: str):
+    versions = sorted(
+        (name for name in os.listdir(collection_dir)
+         if name.startswith("v") and os.path.isdir(os.path.join(collection_dir, name))),
+        key=lambda name: int(name[1:])
+    )
+    for name in versions[:-KEEP_VERSIONS]:
+        # Open files stay readable on POSIX; elsewhere a busy version is simply kept
+        shutil.rmtree(os.path.join(collection_dir, name), ignore_errors=True)
+
+def current_version(collection_dir: str) -> str:
+    try:
+        with open(os.path.join(collection_dir, CURRENT_FILE)) as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"No local vector index at '{collection_dir}'. "
+            "Run scripts/ingest_pdfs.py with VECTOR_BACKEND=local first."
+        ) from None
+
+class LocalVectorIndex:
+    """
+    Read-only view over one version directory written by write_index().
+    """
+
+    def __init__(self, index_dir: str):
+        self.index_dir = index_dir
+        # mmap_mode="r": pages are shared between workers via the OS page cache
+        self.vectors = np.load(os.path.join(index_dir, VECTORS_FILE), mmap_mode="r")
+
+        # Opened together with the vectors so both always come from the same build.
+        # Searches run in executor threads, hence check_same_thread=False + a lock.
+        payloads_uri = f"file:{os.path.join(index_dir, PAYLOADS_FILE)}?mode=ro"
+        self._conn = sqlite3.connect(payloads_uri, uri=True, check_same_thread=False)
+        self._conn_lock = threading.Lock()
+
+        (num_payloads,) = self._conn.execute("SELECT COUNT(*) FROM points").fetchone()
+        if num_payloads != len(self):
+            self._conn.close()
+            raise ValueError(
+                f"Corrupt local index '{index_dir}': {len(self)} vectors but {num_payloads} payloads"
+            )
+
+    def __len__(self) -> int:
+        return self.vectors.shape[0]
+
+    def close(self):
+        with self._conn_lock:
+            self._conn.close()
+
+    def _load_payloads(self, ids: list[int]) -> dict[int, dict]:
+        if not ids:
+            return {}
+        placeholders = ",".join("?" * len(ids))
+        with self._conn_lock:
+            rows = self._conn.execute(
+                f"SELECT id, payload FROM points WHERE id IN ({placeholders})", ids
+            ).fetchall()
+        return {row_id: json.loads(payload) for row_id, payload in rows}
+
+    def search_batch(self, query_vectors, top_k: int = 5) -> list[list[LocalPoint]]:
+        """
+        Exact cosine top_k for every query vector. Returns one list per query.
+        """
+        queries = np.atleast_2d(np.asarray(query_vectors, dtype=np.float32))
+        queries = queries / np.maximum(np.linalg.norm(queries, axis=1, keepdims=True), 1e-12)
+
+        n = len(self)
+        top_k = min(top_k, n)
+        if top_k == 0:
+            return [[] for _ in range(len(queries))]
+
+        # 1. Running top_k per query, merged block by block (argpartition is O(block))
+        top_scores = np.full((len(queries), top_k), -np.inf, dtype=np.float32)
+        top_ids = np.full((len(queries), top_k), -1, dtype=np.int64)
+        for start in range(0, n, SEARCH_BLOCK_ROWS):
+            block = np.asarray(self.vectors[start:start + SEARCH_BLOCK_ROWS], dtype=np.float32)
+            block_scores = queries @ block.T
+
+            k = min(top_k, len(block))
+            block_ids = np.argpartition(-block_scores, k - 1, axis=1)[:, :k]
+            candidate_scores = np.concatenate(
+                [top_scores, np.take_along_axis(block_scores, block_ids, axis=1)], axis=1
+            )
+            candidate_ids = np.concatenate([top_ids, block_ids + start], axis=1)
+
+            keep = np.argpartition(-candidate_scores, top_k - 1, axis=1)[:, :top_k]
+            top_scores = np.take_along_axis(candidate_scores, keep, axis=1)
+            top_ids = np.take_along_axis(candidate_ids, keep, axis=1)
+
+        # 2. Order only the top_k
+        order = np.argsort(-top_scores, axis=1)
+        top_ids = np.take_along_axis(top_ids, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+        # 3. Fetch all payloads needed by the batch in one query
+        payloads = self._load_payloads(sorted({int(i) for i in top_ids.ravel()}))
+
+        return [
+            [
+                LocalPoint(id=int(i), score=float(s), payload=dict(payloads[int(i)]))
+                for i, s in zip(ids_row, scores_row)
+            ]
+            for ids_row, scores_row in zip(top_ids, top_scores)
+        ]
+
+    def search(self, query_vector, top_k: int = 5) -> list[LocalPoint]:
+        return self.search_batch([query_vector], top_k=top_k)[0]
+
+def open_index(collection_dir: str) -> LocalVectorIndex:
+    """
+    Opens the live version of a collection.
+    """
+    return LocalVectorIndex(os.path.join(collection_dir, current_version(collection_dir)))
+
+_indexes: dict[str, LocalVectorIndex] = {}
+_checked_at: dict[str, float] = {}
+# Replaced indexes are closed one swap later, so searches still running on them can finish
+_retired: dict[str, LocalVectorIndex] = {}
+_indexes_lock = threading.Lock()
+
+def get_index(base_dir: str, collection_name: str) -> LocalVectorIndex:
+    """
+    Returns the per-process index for a collection. At most every
+    VERSION_CHECK_INTERVAL seconds it checks whether ingest_pdfs.py has
+    published a new version and, if so, switches to it.
+    """
+    collection_dir = os.path.join(base_dir, collection_name)
+    with _indexes_lock:
+        index = _indexes.get(collection_dir)
+        now = time.monotonic()
+        if index is not None and now - _checked_at[collection_dir] < VERSION_CHECK_INTERVAL:
+            return index
+
+        version_dir = os.path.join(collection_dir, current_version(collection_dir))
+        _checked_at[collection_dir] = now
+        if index is not None and index.index_dir == version_dir:
+            return index
+
+        new_index = LocalVectorIndex(version_dir)
+        if index is not None:
+            if collection_dir in _retired:
+                _retired[collection_dir].close()
+            _retired[collection_dir] = index
+        _indexes[collection_dir] = new_index
+        return new_index
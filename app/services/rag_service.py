@@ -1,8 +1,9 @@
 import asyncio
 from google import genai
-from qdrant_client import QdrantClient
+from qdrant_client import QdrantClient, models
 from sentence_transformers import SentenceTransformer
 from app.core.config import settings
+from app.services import local_index
 
 # --- Initialization ---
 
@@ -13,11 +14,21 @@ client = genai.Client(api_key=settings.GEMINI_API_KEY)
 print("Loading Multilingual Embedding Model...")
 embedder = SentenceTransformer("paraphrase-multilingual-MiniLM-L12-v2")
 
-# 3. Connect to Qdrant
-qclient = QdrantClient(
-    url=settings.QDRANT_URL,
-    api_key=settings.QDRANT_API_KEY,
-)
+# 3. Connect to Qdrant (only needed for the remote backend)
+qclient = None
+if settings.VECTOR_BACKEND == "qdrant":
+    qclient = QdrantClient(
+        url=settings.QDRANT_URL,
+        api_key=settings.QDRANT_API_KEY,
+    )
+
+def load_local_index(collection_name: str):
+    """
+    Opens and validates the local index at startup, so a missing or broken
+    index stops the app instead of failing every request.
+    """
+    index = local_index.get_index(settings.LOCAL_INDEX_DIR, collection_name)
+    print(f"Local vector index loaded: {index.index_dir} ({len(index)} vectors)")
 
 async def get_embedding(text: str) -> list[float]:
     """
@@ -26,12 +37,24 @@ async def get_embedding(text: str) -> list[float]:
     loop = asyncio.get_running_loop()
     return await loop.run_in_executor(None, embedder.encode, text)
 
+async def get_embeddings(texts: list[str]) -> list[list[float]]:
+    """
+    Generates vector embeddings for many queries in a single encode call.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, embedder.encode, texts)
+
 async def search_vector_db(query_vector: list[float], collection_name: str, top_k: int = 5):
     """
     Asynchronously searches Qdrant using the Universal 'query_points' method.
     This works on ALL versions of Qdrant Client.
+    With VECTOR_BACKEND="local" the embedded on-disk index is searched instead.
     """
     loop = asyncio.get_running_loop()
+
+    if settings.VECTOR_BACKEND == "local":
+        index = local_index.get_index(settings.LOCAL_INDEX_DIR, collection_name)
+        return await loop.run_in_executor(None, index.search, query_vector, top_k)
     
     # We use query_points, which is the "raw" search method
     results = await loop.run_in_executor(
@@ -45,6 +68,33 @@ async def search_vector_db(query_vector: list[float], collection_name: str, top_
     )
     return results
 
+async def search_vector_db_batch(query_vectors: list[list[float]], collection_name: str, top_k: int = 5) -> list[list]:
+    """
+    Searches Qdrant for many query vectors in one round-trip using 'query_batch_points'.
+    Returns one list of points per query vector, in the same order.
+    """
+    if len(query_vectors) == 0:
+        return []
+
+    loop = asyncio.get_running_loop()
+
+    if settings.VECTOR_BACKEND == "local":
+        index = local_index.get_index(settings.LOCAL_INDEX_DIR, collection_name)
+        return await loop.run_in_executor(None, index.search_batch, query_vectors, top_k)
+
+    requests = [
+        models.QueryRequest(query=list(map(float, vector)), limit=top_k, with_payload=True)
+        for vector in query_vectors
+    ]
+    responses = await loop.run_in_executor(
+        None,
+        lambda: qclient.query_batch_points(
+            collection_name=collection_name,
+            requests=requests
+        )
+    )
+    return [response.points for response in responses]
+
 def format_rag_prompt(query: str, retrieved_docs: list, fertilizer_info: dict | None, language: str = "en") -> str:
     """
     Constructs the prompt for Gemini.
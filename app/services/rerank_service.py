@@ -41,4 +41,37 @@ async def rerank_documents(query: str, docs: list, top_k: int = 5) -> list:
     scored_docs.sort(key=lambda x: x.payload["rerank_score"], reverse=True)
 
     # 4. Return the top K
-    return scored_docs[:top_k]
\ No newline at end of file
+    return scored_docs[:top_k]
+
+async def rerank_documents_batch(queries: list[str], docs_per_query: list[list], top_k: int = 5) -> list[list]:
+    """
+    Batched version of rerank_documents: scores every (query, doc) pair of
+    every query in a single Cross-Encoder pass, then splits the scores back
+    per query. Returns one top_k list per query, in the same order.
+    """
+    # 1. Flatten all pairs, remembering which query each block belongs to
+    pairs = []
+    for query, docs in zip(queries, docs_per_query):
+        for doc in docs:
+            doc_text = doc.payload.get("text") or doc.payload.get("chunk") or ""
+            pairs.append([query, doc_text])
+
+    if not pairs:
+        return [[] for _ in queries]
+
+    # 2. Score everything at once (off the event loop)
+    loop = asyncio.get_running_loop()
+    scores = await loop.run_in_executor(None, reranker.predict, pairs)
+
+    # 3. Split the scores back per query, attach and sort
+    reranked = []
+    offset = 0
+    for docs in docs_per_query:
+        for doc, score in zip(docs, scores[offset:offset + len(docs)]):
+            doc.payload["rerank_score"] = float(score)
+        offset += len(docs)
+
+        scored_docs = sorted(docs, key=lambda x: x.payload["rerank_score"], reverse=True)
+        reranked.append(scored_docs[:top_k])
+
+    return reranked
@@ -0,0 +1,165 @@
+# Multilingual names for every crop in the fertilizer table, keyed by Fertilizer.crop_name.
+# The English crop_name itself (with "_" read as a space) is always matched, so only
+# extra names are listed: English synonyms/plurals, Hindi + Marathi (Devanagari),
+# Telugu, Tamil, and the romanised spellings farmers actually type.
+# Entries are normalised with app.utils.text.normalize_text() when the matcher is built,
+# so nukta / candrabindu / case variants do not need separate entries.
+# Words that also have an everyday meaning ("yellow", "orange", "you", "leaf", "common",
+# Marathi केला "did", पेरू "let me sow", English "til") are only listed in a
+# qualified form (పసుపు పంట, आम का पेड़, पेरूची), because the matcher
+# prefers the longest name and would otherwise override the crop actually asked about.
+
+from app.utils.text import normalize_text
+
+CROP_ALIASES: dict[str, list[str]] = {
+    "rice": ["चावल", "तांदूळ", "బియ్యం", "அரிசி", "chawal", "chaval", "biyyam", "arisi"],
+    "wheat": ["गेहूं", "गेहू", "गहू", "గోధుమ", "గోధుమలు", "கோதுமை", "gehun", "gehu", "gehoon", "gahu", "godhuma", "godhumalu", "kothumai", "gothumai"],
+    "maize": ["corn", "मक्का", "मकई", "मका", "మొక్కజొన్న", "மக்காச்சோளம்", "makka", "makkai", "makai", "mokkajonna", "makkacholam"],
+    "groundnut": ["peanut", "peanuts", "मूंगफली", "भुईमूग", "शेंगदाणा", "వేరుశనగ", "వేరుశెనగ", "நிலக்கடலை", "வேர்க்கடலை", "moongphali", "mungfali", "moongfali", "bhuimug", "verusanaga", "verusenaga", "nilakadalai", "verkadalai"],
+    "cotton": ["कपास", "कापूस", "పత్తి", "பருத்தி", "kapas", "kapus", "paruthi"],
+    "sugarcane": ["sugar cane", "गन्ना", "ऊस", "చెరకు", "చెరుకు", "கரும்பு", "ganna", "cheraku", "cheruku", "karumbu"],
+    "potato": ["potatoes", "आलू", "बटाटा", "బంగాళాదుంప", "ఆలుగడ్డ", "உருளைக்கிழங்கு", "aloo", "batata", "bangaladumpa", "alugadda", "urulaikizhangu"],
+    "paddy": ["धान", "भात", "వరి", "நெல்", "dhaan", "nel"],
+    "soybean": ["soybeans", "soyabean", "soya bean", "soya", "सोयाबीन", "సోయాబీన్", "சோயாபீன்ஸ்", "சோயா"],
+    "barley": ["जौ", "जव", "బార్లీ", "பார்லி", "jow"],
+    "sorghum": ["jowar", "jowari", "ज्वार", "ज्वारी", "జొన్న", "జొన్నలు", "சோளம்", "jonna", "jonnalu", "cholam"],
+    "pearl_millet": ["bajra", "bajri", "बाजरा", "बाजरी", "సజ్జ", "సజ్జలు", "கம்பு", "sajja", "sajjalu", "kambu"],
+    "finger_millet": ["ragi", "nachni", "mandua", "रागी", "मडुआ", "नाचणी", "రాగి", "రాగులు", "கேழ்வரகு", "ராகி", "ragulu", "kezhvaragu"],
+    "oat": ["oats", "जई", "ఓట్స్", "ஓட்ஸ்"],
+    "chickpea": ["chickpeas", "bengal gram", "chana", "channa", "चना", "हरभरा", "శనగ", "సెనగ", "శనగలు", "கொண்டைக்கடலை", "harbhara", "senaga", "sanaga", "kondaikadalai"],
+    "pigeon_pea": ["red gram", "redgram", "arhar", "tur", "toor", "tuvar", "अरहर", "तुअर", "तूर", "కంది", "కందులు", "துவரை", "kandi", "kandulu", "thuvarai"],
+    "black_gram": ["urad", "urd", "उड़द", "उडीद", "మినుము", "మినుములు", "உளுந்து", "udid", "minumu", "minumulu", "ulundu", "ulunthu"],
+    "green_gram": ["moong", "mung", "mung bean", "मूंग", "मूग", "పెసర", "పెసలు", "பாசிப்பயறு", "பச்சைப்பயறு", "pesara", "pesalu", "pasipayaru"],
+    "lentil": ["lentils", "masoor", "masur", "मसूर", "మసూర్", "மசூர்"],
+    "pea": ["peas", "green peas", "matar", "mattar", "मटर", "वाटाणा", "బఠానీ", "பட்டாணி", "vatana", "batani", "pattani"],
+    "mustard": ["sarson", "सरसों", "मोहरी", "ఆవాలు", "கடுகு", "mohari", "aavalu", "avalu", "kadugu"],
+    "rapeseed": ["toria", "तोरिया"],
+    "sunflower": ["surajmukhi", "सूरजमुखी", "सूर्यफूल", "పొద్దుతిరుగుడు", "சூரியகாந்தி", "suryaphul", "poddutirugudu", "suryakanthi"],
+    "sesame": ["til ki kheti", "gingelly", "तिल", "तीळ", "నువ్వులు", "எள்", "teel", "nuvvulu", "ellu"],
+    "linseed": ["flaxseed", "flax", "alsi", "अलसी", "जवस", "అవిసె", "ஆளி விதை", "javas", "avise"],
+    "castor": ["arandi", "अरंडी", "एरंडी", "एरंड", "ఆముదం", "ஆமணக்கு", "erandi", "amudam", "amanakku"],
+    "safflower": ["kusum", "करडई", "कुसुम", "కుసుమ", "குசம்பப்பூ", "kardai", "kusuma"],
+    "tobacco": ["तंबाकू", "तम्बाकू", "तंबाखू", "పొగాకు", "புகையிலை", "tambaku", "tambakhu", "pogaku", "pugaiyilai"],
+    "jute": ["patsan", "जूट", "पटसन", "జనుము", "சணல்", "janumu", "sanal"],
+    "mesta": ["kenaf", "मेस्ता", "अंबाडी", "గోగు", "ambadi", "gogu"],
+    "sugarbeet": ["sugar beet", "शुगर बीट", "చక్కెర దుంప"],
+    "carrot": ["carrots", "gajar", "गाजर", "క్యారెట్", "கேரட்"],
+    "onion": ["onions", "pyaz", "pyaaz", "pyaj", "kanda", "प्याज", "कांदा", "ఉల్లిపాయ", "ఉల్లి", "வெங்காயம்", "ullipaya", "ulli", "vengayam"],
+    "garlic": ["lahsun", "lehsun", "लहसुन", "लसूण", "వెల్లుల్లి", "பூண்டு", "lasun", "vellulli", "poondu"],
+    "tomato": ["tomatoes", "tamatar", "टमाटर", "टोमॅटो", "टोमाटो", "టమాటా", "టమోటా", "தக்காளி", "tamata", "tomata", "thakkali"],
+    "brinjal": ["eggplant", "aubergine", "baingan", "बैंगन", "वांगी", "वांगे", "వంకాయ", "கத்தரிக்காய்", "கத்தரி", "vangi", "vankaya", "kathirikai"],
+    "chilli": ["chili", "chilies", "chillies", "green chilli", "red chilli", "mirch", "mirchi", "मिर्च", "मिर्ची", "मिरची", "మిరప", "మిరపకాయ", "మిర్చి", "மிளகாய்", "mirapa", "mirapakaya", "milagai", "milakai"],
+    "capsicum": ["bell pepper", "shimla mirch", "शिमला मिर्च", "ढोबळी मिरची", "క్యాప్సికం", "குடைமிளகாய்", "dhobli mirchi", "kudaimilagai"],
+    "okra": ["ladyfinger", "lady finger", "ladies finger", "bhindi", "भिंडी", "भेंडी", "బెండకాయ", "బెండ", "வெண்டைக்காய்", "வெண்டை", "bhendi", "bendakaya", "vendakkai"],
+    "cabbage": ["patta gobhi", "band gobhi", "पत्ता गोभी", "पत्तागोभी", "बंदगोभी", "बंद गोभी", "कोबी", "క్యాబేజీ", "முட்டைக்கோஸ்", "kobi", "muttaikose"],
+    "cauliflower": ["phool gobhi", "phoolgobhi", "gobhi", "gobi", "फूलगोभी", "फूल गोभी", "गोभी", "फुलकोबी", "కాలీఫ్లవర్", "காலிஃபிளவர்", "phulkobi"],
+    "radish": ["mooli", "muli", "मूली", "मुळा", "ముల్లంగి", "முள்ளங்கி", "mullangi"],
+    "turnip": ["shalgam", "शलगम", "शलजम", "టర్నిప్", "டர்னிப்"],
+    "spinach": ["palak", "पालक", "పాలకూర", "பசலைக்கீரை", "palakura", "pasalai keerai"],
+    "fenugreek": ["methi", "मेथी", "మెంతులు", "మెంతికూర", "வெந்தயம்", "menthulu", "menthikura", "vendhayam"],
+    "coriander": ["cilantro", "dhaniya", "dhania", "धनिया", "कोथिंबीर", "धणे", "కొత్తిమీర", "ధనియాలు", "கொத்தமல்லி", "kothimbir", "kothimeera", "kothamalli"],
+    "cumin": ["jeera", "jira", "जीरा", "जिरे", "జీలకర్ర", "சீரகம்", "jeelakarra", "seeragam"],
+    "fennel": ["saunf", "sonf", "सौंफ", "बडीशेप", "సోంపు", "பெருஞ்சீரகம்", "badishep", "sompu", "perunjeeragam"],
+    "dill": ["सोआ", "सुवा", "శతపుష్పం", "சதகுப்பை", "shepu", "शेपू"],
+    "mint": ["pudina", "pudeena", "पुदीना", "पुदिना", "పుదీనా", "புதினா"],
+    "basil": ["tulsi", "tulasi", "तुलसी", "तुळस", "తులసి", "துளசி", "tulas", "thulasi"],
+    "parsley": ["पार्सले"],
+    "pumpkin": ["kaddu", "कद्दू", "भोपळा", "लाल भोपळा", "గుమ్మడి", "గుమ్మడికాయ", "பூசணி", "பூசணிக்காய்", "bhopla", "gummadi", "gummadikaya", "poosani"],
+    "bottle_gourd": ["lauki", "ghiya", "dudhi", "लौकी", "घीया", "दुधी", "दुधी भोपळा", "సొరకాయ", "ఆనపకాయ", "சுரைக்காய்", "sorakaya", "anapakaya", "suraikkai"],
+    "bitter_gourd": ["karela", "karla", "करेला", "कारले", "కాకరకాయ", "కాకర", "பாகற்காய்", "kakarakaya", "pavakkai", "pagarkai"],
+    "ridge_gourd": ["turai", "torai", "तोरई", "तुरई", "दोडका", "బీరకాయ", "பீர்க்கங்காய்", "dodka", "beerakaya", "peerkangai"],
+    "sponge_gourd": ["nenua", "gilki", "नेनुआ", "घिया तोरी", "गिलकी", "घोसाळे", "నేతి బీరకాయ", "ghosale", "neti beerakaya"],
+    "cucumber": ["kheera", "khira", "kakdi", "खीरा", "ककड़ी", "काकडी", "దోసకాయ", "வெள்ளரிக்காய்", "வெள்ளரி", "kakadi", "dosakaya", "vellarikkai"],
+    "watermelon": ["tarbooz", "tarbuj", "तरबूज", "कलिंगड", "పుచ్చకాయ", "தர்பூசணி", "kalingad", "puchakaya", "tharpoosani"],
+    "muskmelon": ["kharbuja", "kharbooja", "खरबूजा", "खरबूज", "కర్బూజ", "முலாம்பழம்", "kharbuj", "karbuja", "mulampazham"],
+    "papaya": ["papita", "पपीता", "पपई", "బొప్పాయి", "பப்பாளி", "papai", "boppayi", "pappali"],
+    "banana": ["bananas", "केले की खेती", "केले का बाग", "केला बाग", "केले के पेड़", "केळी", "అరటి", "అరటిపండు", "வாழை", "வாழைப்பழம்", "arati", "vazhai", "vaazhai"],
+    "mango": ["mangoes", "आम का पेड़", "आम के पेड़", "आम की खेती", "आम का बाग", "आम के बाग", "aam ka ped", "aam ke ped", "आंबा", "మామిడి", "மாம்பழம்", "மாமரம்", "amba", "mamidi", "mambazham"],
+    "guava": ["amrood", "amrud", "अमरूद", "पेरूची", "पेरूच्या", "पेरूचे", "पेरूला", "జామ", "జామకాయ", "கொய்யா", "koyya"],
+    "sapota": ["chikoo", "chiku", "sapodilla", "चीकू", "चिकू", "సపోటా", "சப்போட்டா"],
+    "pomegranate": ["anar", "अनार", "डाळिंब", "దానిమ్మ", "மாதுளை", "dalimb", "danimma", "mathulai"],
+    "citrus": ["lemon", "orange tree", "orange orchard", "orange crop", "mosambi", "sweet lime", "kinnow", "nimbu", "santra", "नींबू", "नीबू", "संतरा", "लिंबू", "संत्रा", "मोसंबी", "నిమ్మ", "బత్తాయి", "எலுமிச்சை", "ஆரஞ்சு மர", "ஆரஞ்சு தோட்ட", "சாத்துக்குடி", "limbu", "nimma", "battayi", "elumichai"],
+    "grapes": ["grape", "angoor", "angur", "अंगूर", "द्राक्ष", "द्राक्षे", "ద్రాక్ష", "திராட்சை", "draksh", "draksha", "thiratchai"],
+    "apple": ["apples", "seb", "सेब", "सफरचंद", "ఆపిల్", "యాపిల్", "ஆப்பிள்", "safarchand"],
+    "pear": ["pears", "nashpati", "नाशपाती", "బేరి", "பேரிக்காய்", "berikai"],
+    "peach": ["peaches", "आड़ू", "पीच", "పీచ్"],
+    "plum": ["plums", "aloo bukhara", "आलूबुखारा", "आलू बुखारा", "ప్లమ్"],
+    "apricot": ["apricots", "khubani", "खुबानी", "जरदालू", "jardalu"],
+    "cherry": ["cherries", "चेरी", "చెర్రీ", "செர்ரி"],
+    "strawberry": ["strawberries", "स्ट्रॉबेरी", "స్ట్రాబెర్రీ", "ஸ்ட்ராபெர்ரி"],
+    "pineapple": ["ananas", "अनानास", "अननस", "అనాస", "అనాసపండు", "அன்னாசி", "anasa", "annasi"],
+    "jackfruit": ["kathal", "katahal", "कटहल", "फणस", "పనస", "பலா", "பலாப்பழம்", "phanas", "panasa"],
+    "cashew": ["kaju", "काजू", "జీడిమామిడి", "జీడిపప్పు", "முந்திரி", "jeedimamidi", "munthiri"],
+    "coconut": ["nariyal", "narial", "नारियल", "नारळ", "కొబ్బరి", "தேங்காய்", "தென்னை", "naral", "kobbari", "thengai", "thennai"],
+    "arecanut": ["areca nut", "betel nut", "supari", "सुपारी", "వక్క", "பாக்கு", "vakka", "pakku"],
+    "coffee": ["कॉफी", "कॉफ़ी", "కాఫీ", "காபி"],
+    "tea": ["tea garden", "chai bagan", "चाय बागान", "चाय की खेती", "चहा मळा", "తేయాకు", "தேயிலை", "theyaku", "theyilai"],
+    "rubber": ["रबड़", "रबर", "రబ్బరు", "ரப்பர்"],
+    "oil_palm": ["oilpalm", "ऑयल पाम", "पाम तेल", "ఆయిల్ పామ్", "எண்ணெய் பனை"],
+    "betel_vine": ["betel", "betel leaf", "paan", "pan leaf", "पानवेल", "नागवेली", "తమలపాకు", "வெற்றிலை", "nagveli", "tamalapaku", "vetrilai"],
+    "turmeric": ["haldi", "हल्दी", "हळद", "పసుపు పంట", "மஞ்சள் பயிர்", "மஞ்சள் சாகுபடி", "halad", "pasupu panta"],
+    "ginger": ["adrak", "अदरक", "अद्रक", "అల్లం", "இஞ்சி", "allam", "inji"],
+    "cardamom": ["elaichi", "ilaichi", "इलायची", "वेलची", "ఏలకులు", "యాలకులు", "ஏலக்காய்", "velchi", "elakulu", "yalakulu", "elakkai"],
+    "black_pepper": ["pepper", "kali mirch", "काली मिर्च", "काळी मिरी", "मिरी", "మిరియాలు", "மிளகு", "kali miri", "miriyalu", "milagu"],
+    "clove": ["cloves", "laung", "लौंग", "लवंग", "లవంగం", "లవంగాలు", "கிராம்பு", "lavang", "lavangam", "kirambu"],
+    "nutmeg": ["jaiphal", "जायफल", "जायफळ", "జాజికాయ", "ஜாதிக்காய்", "jajikaya", "jathikai"],
+    "vanilla": ["वनीला", "वेनिला", "వెనిలా", "வெண்ணிலா"],
+    "areca": ["अरेका"],
+    "lemon_grass": ["lemongrass", "लेमनग्रास", "लेमन ग्रास", "गवती चहा", "నిమ్మగడ్డి", "எலுமிச்சைப் புல்", "gavati chaha", "nimmagaddi"],
+    "sweet_potato": ["sweet potatoes", "shakarkand", "शकरकंद", "रताळे", "చిలగడదుంప", "சர்க்கரைவள்ளிக் கிழங்கு", "சர்க்கரைவள்ளி", "ratale", "chilagada dumpa", "sakkaravalli"],
+    "yam": ["elephant foot yam", "suran", "jimikand", "सूरन", "जिमीकंद", "सुरण", "కంద", "சேனைக்கிழங்கு", "kanda gadda", "senaikizhangu"],
+    "colocasia": ["taro", "arbi", "arvi", "अरबी", "अरवी", "अळू", "చామదుంప", "చేమదుంప", "சேப்பங்கிழங்கு", "chamadumpa", "seppankizhangu"],
+    "amaranthus": ["amaranth", "chaulai", "rajgira", "चौलाई", "राजगिरा", "తోటకూర", "முளைக்கீரை", "அரைக்கீரை", "thotakura", "mulai keerai"],
+    "drumstick": ["moringa", "sahjan", "saijan", "shevga", "सहजन", "सहिजन", "शेवगा", "మునగ", "మునగకాయ", "முருங்கை", "முருங்கைக்காய்", "munaga", "murungai", "murungakkai"],
+    "beetroot": ["beet", "चुकंदर", "बीट", "बीटरूट", "బీట్రూట్", "பீட்ரூட்", "chukandar"],
+    "lettuce": ["सलाद पत्ता", "लेट्यूस", "లెట్యూస్"],
+    "broccoli": ["ब्रोकली", "ब्रोकोली", "బ్రోకలీ", "ப்ரோக்கோலி"],
+    "kale": ["केल"],
+    "leek": ["leeks"],
+    "celery": ["सेलेरी"],
+    "artichoke": ["artichokes", "आटिचोक", "हाथी चक"],
+    "asparagus": ["shatavari", "शतावरी", "సతావరి", "தண்ணீர்விட்டான்"],
+}
+
+# Marathi attaches case suffixes to the noun, usually to an oblique stem
+# (गहू -> गव्हाला, कापूस -> कापसासाठी, टोमॅटो -> टोमॅटोचे). These stems match
+# with any suffix following them, unlike the whole-word names above.
+MARATHI_STEMS: dict[str, list[str]] = {
+    "wheat": ["गव्हा"],
+    "cotton": ["कापसा"],
+    "sugarcane": ["उसा"],
+    "rice": ["तांदळा"],
+    "paddy": ["भाता"],
+    "maize": ["मक्या"],
+    "groundnut": ["भुईमुगा", "शेंगदाण्या"],
+    "soybean": ["सोयाबीन"],
+    "sorghum": ["ज्वारी"],
+    "pearl_millet": ["बाजरी"],
+    "finger_millet": ["नाचणी"],
+    "chickpea": ["हरभऱ्या", "हरभर्या"],
+    "pigeon_pea": ["तुरी"],
+    "onion": ["कांद्या"],
+    "garlic": ["लसणा"],
+    "potato": ["बटाट्या"],
+    "tomato": ["टोमॅटो"],
+    "brinjal": ["वांग्या"],
+    "chilli": ["मिरची"],
+    "okra": ["भेंडी"],
+    "cabbage": ["कोबी"],
+    "cauliflower": ["फुलकोबी"],
+    "sunflower": ["सूर्यफुला"],
+    "turmeric": ["हळदी"],
+    "banana": ["केळी"],
+    "mango": ["आंब्या"],
+    "pomegranate": ["डाळिंबा"],
+    "grapes": ["द्राक्षा"],
+    "coconut": ["नारळा"],
+}
+
+def crop_phrases(crop_name: str) -> tuple[list[str], list[str]]:
+    """
+    Normalised (whole-word names, suffix-taking stems) for one crop.
+    """
+    names = [normalize_text(a) for a in [crop_name, *CROP_ALIASES.get(crop_name, [])]]
+    stems = [normalize_text(a) for a in MARATHI_STEMS.get(crop_name, [])]
+    return names, stems
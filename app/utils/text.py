@@ -0,0 +1,110 @@
+import re
+import unicodedata
+from collections import deque
+
+# Characters that only change how Indic text is rendered, not what it says
+_STRIP_CHARS = {
+    "\u200c": None,  # ZERO WIDTH NON-JOINER
+    "\u200d": None,  # ZERO WIDTH JOINER
+    "\u093c": None,  # DEVANAGARI SIGN NUKTA  (ज़ -> ज, ड़ -> ड)
+}
+# Spelling variants people use interchangeably
+_FOLD_CHARS = {
+    "\u0901": "\u0902",  # DEVANAGARI CANDRABINDU -> ANUSVARA (गेहूँ -> गेहूं)
+    "_": " ",
+    "-": " ",
+}
+_TRANSLATION = str.maketrans({**_STRIP_CHARS, **_FOLD_CHARS})
+_WHITESPACE = re.compile(r"\s+")
+
+def normalize_text(text: str) -> str:
+    """
+    Canonical form used for matching user text in any supported language:
+    NFC, case-folded, nukta/joiners removed, candrabindu folded, whitespace collapsed.
+    """
+    text = unicodedata.normalize("NFC", text)
+    # NFC decomposes some nukta letters (क़ -> क + ़), so strip after normalising
+    text = text.casefold().translate(_TRANSLATION)
+    return _WHITESPACE.sub(" ", text).strip()
+
+def _is_mark(char: str) -> bool:
+    return unicodedata.category(char).startswith("M")
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or _is_mark(char)
+
+# Telugu and Tamil glue suffixes onto nouns (గోధుమలు, கோதுமைக்கு), so a phrase in
+# these scripts may end mid-word as long as it does not end mid-syllable
+_AGGLUTINATIVE_SCRIPTS = ("TELUGU", "TAMIL")
+
+def _allows_suffix(phrase: str) -> bool:
+    return unicodedata.name(phrase[-1], "").startswith(_AGGLUTINATIVE_SCRIPTS)
+
+class PhraseMatcher:
+    """
+    Aho-Corasick automaton over a fixed set of phrases.
+    find_longest() scans a text once (O(len(text)) plus matches) and returns the
+    value of the longest phrase found on word boundaries, earliest on ties.
+    Phrases in 'stems' may also be followed by a suffix in any script
+    (e.g. Marathi गव्हा + ला). Phrases and texts are expected to be
+    normalize_text()-ed already.
+    """
+
+    def __init__(self, phrases: dict[str, object], stems: dict[str, object] | None = None):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # Per state: (phrase_length, allows_suffix, value) for every phrase ending here
+        self._out: list[list[tuple[int, bool, object]]] = [[]]
+
+        # 1. Trie
+        entries = [(phrase, value, _allows_suffix(phrase)) for phrase, value in phrases.items()]
+        entries += [(stem, value, True) for stem, value in (stems or {}).items()]
+        for phrase, value, allows_suffix in entries:
+            if not phrase:
+                continue
+            state = 0
+            for char in phrase:
+                if char not in self._goto[state]:
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                    self._goto[state][char] = len(self._goto) - 1
+                state = self._goto[state][char]
+            self._out[state].append((len(phrase), allows_suffix, value))
+
+        # 2. Failure links (BFS), merging outputs of the fallback state
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def __len__(self) -> int:
+        return len(self._goto)
+
+    def find_longest(self, text: str):
+        best = None  # (length, -start, value)
+        state = 0
+        for end, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+
+            for length, allows_suffix, value in self._out[state]:
+                start = end - length + 1
+                if start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if end + 1 < len(text):
+                    next_char = text[end + 1]
+                    if _is_mark(next_char) or (not allows_suffix and _is_word_char(next_char)):
+                        continue
+                candidate = (length, -start, value)
+                if best is None or candidate[:2] > best[:2]:
+                    best = candidate
+
+        return best[2] if best else None
@@ -0,0 +1,106 @@
+import sys
+import os
+import time
+import random
+import tempfile
+import numpy as np
+from qdrant_client import QdrantClient
+from sentence_transformers import SentenceTransformer
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app.core.config import settings
+from app.services import local_index
+
+# --- Configuration ---
+COLLECTION_NAME = "docs_kisangpt_advanced"
+TOP_K = 15              # Same "wide net" as /ask
+NUM_SAMPLED_QUERIES = 50
+DTYPES = ["float32", "float16"]
+
+TEXT_QUERIES = [
+    "What is the recommended fertilizer dose for wheat?",
+    "What is the market price of Chilli in Guntur?",
+    "How to control yellow rust in wheat?",
+    "Medicine for stem borer in maize?",
+    "Tell me about fish pond preparation in Assam.",
+    "गेहूं में कितना यूरिया डालें?",
+]
+
+def export_collection(client: QdrantClient) -> tuple[list, list, list]:
+    """
+    Pulls every point (id, vector, payload) out of the remote collection.
+    """
+    ids, vectors, payloads = [], [], []
+    offset = None
+    while True:
+        points, offset = client.scroll(
+            collection_name=COLLECTION_NAME,
+            limit=256,
+            offset=offset,
+            with_payload=True,
+            with_vectors=True
+        )
+        for p in points:
+            ids.append(p.id)
+            vectors.append(p.vector)
+            payloads.append(p.payload or {})
+        if offset is None:
+            return ids, vectors, payloads
+
+def percentiles(latencies: list[float]) -> str:
+    ms = np.array(latencies) * 1000
+    return f"p50={np.percentile(ms, 50):7.2f} ms | p95={np.percentile(ms, 95):7.2f} ms"
+
+def run_benchmark():
+    print("⏱️  Vector Search Benchmark: remote Qdrant vs local index")
+    client = QdrantClient(url=settings.QDRANT_URL, api_key=settings.QDRANT_API_KEY)
+
+    # 1. Mirror the remote collection into a temporary local index
+    print(f"📥 Exporting '{COLLECTION_NAME}' from Qdrant...")
+    ids, vectors, payloads = export_collection(client)
+    print(f"   -> {len(ids)} points")
+    if not ids:
+        print("❌ Collection is empty, nothing to benchmark.")
+        return
+
+    # 2. Build the query set: real questions + stored chunks used as queries
+    embedder = SentenceTransformer("paraphrase-multilingual-MiniLM-L12-v2")
+    queries = [v.tolist() for v in embedder.encode(TEXT_QUERIES)]
+    queries += random.sample(vectors, min(NUM_SAMPLED_QUERIES, len(vectors)))
+
+    # 3. Remote latency
+    remote_hits, remote_latencies = [], []
+    for q in queries:
+        t0 = time.perf_counter()
+        points = client.query_points(
+            collection_name=COLLECTION_NAME, query=q, limit=TOP_K, with_payload=True
+        ).points
+        remote_latencies.append(time.perf_counter() - t0)
+        remote_hits.append([p.id for p in points])
+
+    print(f"\n🌐 Qdrant (remote)     {percentiles(remote_latencies)}")
+
+    # 4. Local latency + recall against the remote results
+    with tempfile.TemporaryDirectory() as tmp:
+        for dtype in DTYPES:
+            index_dir = local_index.write_index(os.path.join(tmp, dtype), vectors, payloads, dtype=dtype)
+            index = local_index.LocalVectorIndex(index_dir)
+            index.search(queries[0], TOP_K) # Warm up page cache + sqlite connection
+
+            local_latencies, recalls = [], []
+            for q, expected in zip(queries, remote_hits):
+                t0 = time.perf_counter()
+                points = index.search(q, TOP_K)
+                local_latencies.append(time.perf_counter() - t0)
+
+                # Local row ids -> original Qdrant ids
+                found = {ids[p.id] for p in points}
+                recalls.append(len(found & set(expected)) / max(len(expected), 1))
+
+            size_mb = os.path.getsize(os.path.join(index_dir, local_index.VECTORS_FILE)) / 1e6
+            print(f"💾 Local ({dtype:<7})    {percentiles(local_latencies)} | "
+                  f"recall@{TOP_K}={np.mean(recalls):.3f} | vectors={size_mb:.1f} MB")
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,84 @@
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app.utils.crop_aliases import CROP_ALIASES, crop_phrases
+from app.utils.text import PhraseMatcher, normalize_text
+
+# (query, expected crop_name or None)
+TEST_DATASET = [
+    # Plain lookups in every supported language
+    ("What is the recommended fertilizer dose for wheat?", "wheat"),
+    ("गेहूँ में कितना यूरिया डालें?", "wheat"),
+    ("గోధుమలకు ఎరువు", "wheat"),
+    ("கோதுமைக்கு உரம்", "wheat"),
+    ("शिमला मिर्च की खेती", "capsicum"),
+    ("What is the market price of Chilli in Guntur?", "chilli"),
+    ("price of fertilizer", None),
+    # Marathi inflected forms
+    ("कापसाला किती खत द्यावे", "cotton"),
+    ("गव्हाला किती युरिया", "wheat"),
+    ("उसासाठी खत", "sugarcane"),
+    ("कांद्याला पाणी किती", "onion"),
+    # Everyday words must not override the crop actually asked about
+    ("వరి ఆకులు పసుపు రంగులోకి మారుతున్నాయి", "paddy"),
+    ("நெல் இலைகள் மஞ்சள் நிறமாக மாறுகிறது", "paddy"),
+    ("నువ్వు చెప్పు గోధుమకు ఎరువు", "wheat"),
+    ("maize crop orange leaves", "maize"),
+    ("टोमॅटोचे पान पिवळे पडले", "tomato"),
+    ("आम आदमी के लिए मक्का की खेती", "maize"),
+    ("पानी कितना देना है", None),
+    ("நெல் இலை ஆரஞ்சு நிறமாக மாறுகிறது", "paddy"),
+    ("ஆரஞ்சு மரத்திற்கு உரம்", "citrus"),
+    # Marathi verb forms (पेरणे "to sow", केला "did") must not look like crops
+    ("गहू पेरून झाल्यावर खत किती द्यावे", "wheat"),
+    ("तूर पेरून झाली", "pigeon_pea"),
+    ("गहू पेरूया का", "wheat"),
+    ("गहू पेरू का", "wheat"),
+    ("पेरूच्या बागेला खत", "guava"),
+    ("तूर पेरणी केला", "pigeon_pea"),
+    ("केले की खेती में खाद", "banana"),
+    ("केळीला किती खत", "banana"),
+    # Short names: each checked against everyday words and competing crops
+    ("तूर आणि हरभरा पेरणी", "chickpea"),
+    ("मिरचीला खत किती", "chilli"),
+    ("काळी मिरी लागवड", "black_pepper"),
+    ("जई की खेती", "oat"),
+    ("गेहूं और जई", "wheat"),
+    ("बीट लागवड", "beetroot"),
+    ("शुगर बीट में खाद", "sugarbeet"),
+    ("भाताला युरिया किती", "paddy"),
+    ("turai ki kheti", "ridge_gourd"),
+    ("tur dal price", "pigeon_pea"),
+    ("urea for wheat til flowering", "wheat"),
+    ("til ki kheti", "sesame"),
+    ("alu vadi recipe", None),
+    ("aloo ki kheti", "potato"),
+    ("kanda lagwad", "onion"),
+    ("kanda gadda cultivation", "yam"),
+    ("after morning tea how much urea for maize", "maize"),
+    ("fertilizer for tea garden", "tea"),
+]
+
+def run_evaluation():
+    print("🌾 Crop Matcher Regression Check")
+    phrases, stems = {}, {}
+    for crop in CROP_ALIASES:
+        names, crop_stems = crop_phrases(crop)
+        phrases.update(dict.fromkeys(names, crop))
+        stems.update(dict.fromkeys(crop_stems, crop))
+    matcher = PhraseMatcher(phrases, stems)
+
+    failures = 0
+    for query, expected in TEST_DATASET:
+        found = matcher.find_longest(normalize_text(query))
+        ok = found == expected
+        failures += not ok
+        print(f"   {'✅' if ok else '❌'} {query} -> {found} (expected {expected})")
+
+    print(f"\n{len(TEST_DATASET) - failures}/{len(TEST_DATASET)} passed")
+    return failures == 0
+
+if __name__ == "__main__":
+    sys.exit(0 if run_evaluation() else 1)
@@ -13,6 +13,7 @@ import pypdf
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from app.core.config import settings
+from app.services import local_index
 
 # --- Configuration ---
 COLLECTION_NAME = "docs_kisangpt_advanced"
@@ -25,7 +26,9 @@ CHILD_OVERLAP = 50
 
 # Initialize AI Clients
 client_gemini = genai.Client(api_key=settings.GEMINI_API_KEY)
-client_qdrant = QdrantClient(url=settings.QDRANT_URL, api_key=settings.QDRANT_API_KEY)
+client_qdrant = None
+if settings.VECTOR_BACKEND == "qdrant":
+    client_qdrant = QdrantClient(url=settings.QDRANT_URL, api_key=settings.QDRANT_API_KEY)
 embedder = SentenceTransformer("paraphrase-multilingual-MiniLM-L12-v2") # Multilingual!
 
 async def extract_metadata_with_ai(text_snippet: str) -> Dict:
@@ -81,10 +84,11 @@ async def ingest_data():
     print("🚀 Starting Advanced Ingestion Pipeline...")
     
     # Recreate Collection
-    client_qdrant.recreate_collection(
-        collection_name=COLLECTION_NAME,
-        vectors_config=models.VectorParams(size=384, distance=models.Distance.COSINE),
-    )
+    if client_qdrant is not None:
+        client_qdrant.recreate_collection(
+            collection_name=COLLECTION_NAME,
+            vectors_config=models.VectorParams(size=384, distance=models.Distance.COSINE),
+        )
 
     pdf_files = glob.glob(os.path.join(PDF_FOLDER, "*.pdf"))
     print(f"📂 Found {len(pdf_files)} PDFs.")
@@ -137,7 +141,17 @@ async def ingest_data():
             global_id += 1
 
     # 6. Upload
-    if all_points:
+    if all_points and settings.VECTOR_BACKEND == "local":
+        collection_dir = os.path.join(settings.LOCAL_INDEX_DIR, COLLECTION_NAME)
+        print(f"💾 Writing {len(all_points)} smart chunks to local index {collection_dir}...")
+        local_index.write_index(
+            collection_dir,
+            embeddings=[p.vector for p in all_points],
+            payloads=[p.payload for p in all_points],
+            dtype=settings.LOCAL_INDEX_DTYPE
+        )
+        print("✅ Advanced Ingestion Complete!")
+    elif all_points:
         print(f"⬆️  Uploading {len(all_points)} smart chunks to Qdrant...")
         client_qdrant.upsert(
             collection_name=COLLECTION_NAME,
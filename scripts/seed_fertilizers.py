@@ -1,16 +1,12 @@
 import sys
 import os
 import asyncio
-from sqlmodel import Session, create_engine, select
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
 
 # Add the root directory to path so we can import 'app'
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.models.fertilizer import Fertilizer
-from app.core.config import settings
-from sqlmodel import SQLModel
+from app.models.fertilizer import FertilizerCreate
+from app.services import db_service
 
 # Copy your dictionary here
 RAW_DATA = {
@@ -124,33 +120,22 @@ RAW_DATA = {
 }
 
 async def init_db():
-    engine = create_async_engine(settings.DATABASE_URL)
-    
     # Create tables
-    async with engine.begin() as conn:
-        await conn.run_sync(SQLModel.metadata.create_all)
+    await db_service.init_db()
 
-    # Insert Data
-    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    
-    async with async_session() as session:
-        for crop, values in RAW_DATA.items():
-            # Check if exists
-            result = await session.execute(select(Fertilizer).where(Fertilizer.crop_name == crop))
-            existing = result.scalars().first()
-            
-            if not existing:
-                print(f"Adding {crop}...")
-                new_fert = Fertilizer(
-                    crop_name=crop,
-                    n_value=values['N'],
-                    p_value=values['P'],
-                    k_value=values['K']
-                )
-                session.add(new_fert)
-        
-        await session.commit()
-        print("Database seeding complete!")
+    # Insert Data - one bulk INSERT ... ON CONFLICT DO NOTHING, existing crops are kept
+    rows = [
+        FertilizerCreate(
+            crop_name=crop,
+            n_value=values['N'],
+            p_value=values['P'],
+            k_value=values['K']
+        )
+        for crop, values in RAW_DATA.items()
+    ]
+    await db_service.upsert_fertilizers(rows, overwrite=False)
+    await db_service.engine.dispose()
+    print(f"Database seeding complete! ({len(rows)} crops)")
 
 if __name__ == "__main__":
     asyncio.run(init_db())
\ No newline at end of file